@@ -65,9 +65,11 @@ app.layout = html.Div(children=[
     html.Br(),
     dcc.Checklist(
         id="toggle",
-        options={"Toggle": "Toggle Multiple Buy/Sell"},
+        options={"Toggle": "Toggle Multiple Buy/Sell", "Segments": "Show Buy/Sell Segments"},
         value=["Toggle"]
     ),
+    html.Label('Max Multiple Buy/Sell Transactions: '),
+    dcc.Input(id='max_transactions', value=15, type='number', min=1, step=1),
     html.Br(),
 
     # Uses ID to identify graph for callback. 
@@ -94,9 +96,10 @@ app.layout = html.Div(children=[
     Input('end_date', 'date'),
     Input('sma_window', 'value'),
     Input('return_type', 'value'),
-    Input('toggle', 'value')
+    Input('toggle', 'value'),
+    Input('max_transactions', 'value')
     )
-def update_line_fig(ticker, start_date, end_date, sma_window, return_type, toggle):
+def update_line_fig(ticker, start_date, end_date, sma_window, return_type, toggle, max_transactions):
     data = get_stock_data(ticker, start_date, end_date)
     if data is None or data.empty or len(data) == 0:
         return error_page("Dates chosen provides no data"), error_page("")
@@ -111,7 +114,11 @@ def update_line_fig(ticker, start_date, end_date, sma_window, return_type, toggl
     if delta_days < sma_window:         # Check if SMA window > date range
         return error_page(f"Selected range is {delta_days} days, but SMA window is {sma_window} days. Please choose a smaller SMA window or a larger date range."), error_page("")
    
-    return fig_main_plot(data, ticker, result, int(sma_window), return_type, bool(toggle)), fig_indicators(data, result['max_profit_single'])
+    if not max_transactions or max_transactions < 1:   # Empty or invalid input falls back to default
+        max_transactions = 15
+
+    return fig_main_plot(data, ticker, result, int(sma_window), return_type, "Toggle" in toggle,
+                         int(max_transactions), "Segments" in toggle), fig_indicators(data, result['max_profit_single'])
 
 if __name__ == '__main__':
     app.run(host="0.0.0.0",debug=True)
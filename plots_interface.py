@@ -4,7 +4,8 @@ from pandas import DataFrame
 from calculations import count_price_runs, compute_sma, compute_daily_returns, max_profit_multiple
 
 
-def fig_main_plot(data:DataFrame, ticker:str, max_profit:dict, sma_window:int, return_type:str, show_multi_buy_sell:bool) -> Figure:
+def fig_main_plot(data:DataFrame, ticker:str, max_profit:dict, sma_window:int, return_type:str, show_multi_buy_sell:bool,
+                  max_transactions:int=15, show_segments:bool=False) -> Figure:
     """Generates main graph that contains 3 types of sub plots.
         1. Scatter plot that contains SMA, Close price and best day to buy/sell.
         2. Bar plot that shows daily returns.
@@ -16,6 +17,10 @@ def fig_main_plot(data:DataFrame, ticker:str, max_profit:dict, sma_window:int, r
         buy_day (Timestamp): Best day to buy the stock.
         sell_day (Timestamp): Best day to sell the stock
         sma_window (int): Defines number of days for SMA calculation.
+        return_type (str): 'simple' or 'log' daily returns.
+        show_multi_buy_sell (bool): Plots multiple buy/sell transactions.
+        max_transactions (int): Max number of multiple buy/sell transactions to plot.
+        show_segments (bool): Draws a line from each buy to its sell point.
 
     Returns:
         Figure (Figure): Returns a plotly figure object.
@@ -93,42 +98,44 @@ def fig_main_plot(data:DataFrame, ticker:str, max_profit:dict, sma_window:int, r
     ), row=3, col=1)
 
     # Plots multiple buy/sell in main scatter plot. row 1
+    # All markers are batched into a single trace (and segments into another)
+    # so figure size stays small even with hundreds of transactions.
     if show_multi_buy_sell:
-        for index, output in enumerate(max_profit_multiple(data, max_profit)):
+        transactions = max_profit_multiple(data, max_profit, max_transactions)
+        marker_x, marker_y, marker_colors, marker_symbols, marker_text = [], [], [], [], []
+        segment_x, segment_y = [], []
+        for index, output in enumerate(transactions):
             buy_date, buy_price, sell_date, sell_price = output
-            fig.add_annotation(
-                x=buy_date, y=buy_price,
-                text=f"BUY{index+1}",  # Number the transactions
-                showarrow=True, 
-                arrowhead=2, 
-                arrowsize=0.7,
-                arrowcolor="crimson", 
-                bgcolor="white", 
-                bordercolor="crimson",
-                font=dict(size=10, color="crimson")
-            )
-
-            fig.add_annotation(
-                x=sell_date, y=sell_price,
-                text=f"SELL{index+1}",  # Number the transactions
-                showarrow=True, 
-                arrowhead=2, 
-                arrowsize=0.7,
-                arrowcolor="lime", 
-                bgcolor="white", 
-                bordercolor="lime", 
-                font=dict(size=10, color="lime")
-            )
+            marker_x += [buy_date, sell_date]
+            marker_y += [buy_price, sell_price]
+            marker_colors += ["crimson", "lime"]
+            marker_symbols += ["triangle-down", "triangle-up"]
+            marker_text += [f"BUY{index+1}", f"SELL{index+1}<br>Profit: {sell_price - buy_price:.2f}"]
 
+            # None breaks the line so each buy/sell pair is a separate segment
+            segment_x += [buy_date, sell_date, None]
+            segment_y += [buy_price, sell_price, None]
+
+        if show_segments and transactions:
+            fig.add_trace(Scatter(
+                x=segment_x,
+                y=segment_y,
+                mode="lines",
+                line=dict(color="grey", width=1, dash="dot"),
+                name="Multi Transaction Segment",
+                hoverinfo="skip"
+            ), row=1, col=1)
+
+        if transactions:
             fig.add_trace(Scatter(
-                x=[buy_date, sell_date],
-                y=[buy_price, sell_price],
-                mode='markers',
-                name='Multi Transaction' if index == 0 else '',
-                marker=dict(size=8, color=['crimson', 'lime'], 
-                        symbol=['triangle-down', 'triangle-up']),
-                showlegend=(index == 0)
-            ))
+                x=marker_x,
+                y=marker_y,
+                mode="markers",
+                name="Multi Transaction",
+                marker=dict(size=8, color=marker_colors, symbol=marker_symbols),
+                hovertext=marker_text,
+                hovertemplate="%{hovertext}<br>%{x}<br>Price: %{y:.2f}<extra></extra>"
+            ), row=1, col=1)
 
     fig.update_layout(
     title=ticker + " Stock Information:",